@@ -0,0 +1,52 @@
+"""
+CSS/JS minifiers for the NeoTech Club website build.
+
+Kept in their own module so they can optionally be compiled with Cython
+(`pixi run compile`); the compiled extension is imported in place of this
+file when present. Plain CPython/PyPy use this source unchanged.
+
+Both minifiers work on bytes: every pattern is ASCII, so UTF-8 input never
+needs to be decoded and re-encoded.
+"""
+
+import re
+
+
+# Patterns used on every CSS/JS file, compiled once at import time.
+# Comments are stripped by a single scan that also matches string literals
+# (kept via group 1), so comment markers inside strings are left alone.
+# Strings can't span lines, so a stray quote never swallows more than a line.
+_STRING = rb'"[^"\\\n]*(?:\\.[^"\\\n]*)*"|\'[^\'\\\n]*(?:\\.[^\'\\\n]*)*\''
+_CSS_COMMENT_RE = re.compile(rb'(' + _STRING + rb')|/\*.*?\*/', re.DOTALL)
+# JS adds template literals, and line comments (only at the start of a line,
+# where they can't be part of a regex literal or URL)
+_JS_COMMENT_RE = re.compile(
+    rb'(' + _STRING + rb'|`[^`\\]*(?:\\.[^`\\]*)*`)|/\*.*?\*/|^[ \t]*//[^\n]*',
+    re.DOTALL | re.MULTILINE,
+)
+# Whitespace around CSS punctuation (dropped) or any other whitespace run (one space)
+_CSS_WS_RE = re.compile(rb'\s*([{}:;,])\s*|\s+')
+_BLANK_LINES_RE = re.compile(rb'\n\s*\n')
+
+
+def _css_ws_sub(match):
+    punct = match.group(1)
+    return b' ' if punct is None else punct
+
+
+def minify_css(css_content):
+    """Basic CSS minification of raw (UTF-8) file contents"""
+    # Remove comments, keeping strings
+    css = _CSS_COMMENT_RE.sub(rb'\1', css_content)
+    # Collapse whitespace and trim it around punctuation in one pass
+    css = _CSS_WS_RE.sub(_css_ws_sub, css)
+    return css.strip()
+
+
+def minify_js(js_content):
+    """Basic JS minification of raw (UTF-8) file contents - just remove multi-line comments and trim whitespace carefully"""
+    # Remove multi-line and whole-line comments, keeping strings
+    js = _JS_COMMENT_RE.sub(rb'\1', js_content)
+    # Only normalize excessive whitespace, don't collapse all spaces
+    js = _BLANK_LINES_RE.sub(b'\n', js)
+    return js
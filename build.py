@@ -8,35 +8,143 @@ Respects exclusions listed in donotbuild.yaml
 
 import os
 import re
-import io
+import sys
+import logging
+import argparse
 import json
-import yaml
 import shutil
 import fnmatch
-from datetime import datetime, time
+import hashlib
+import mmap
+import platform
+import functools
+from itertools import repeat
+from collections import Counter, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, time, timezone
 try:
     # Python 3.9+
     from zoneinfo import ZoneInfo
 except Exception:
     # Fallback placeholder; if zoneinfo missing, use UTC-only behavior
     ZoneInfo = None
+# Event times without a timezone are IST; left as None (naive datetimes
+# throughout) when zoneinfo or the tz database is unavailable
+_IST = _UTC = None
+if ZoneInfo is not None:
+    try:
+        _IST = ZoneInfo('Asia/Kolkata')
+        _UTC = ZoneInfo('UTC')
+    except Exception:
+        _IST = _UTC = None
+# Sort sentinels for undated events, comparable with the parsed event datetimes
+_LATEST = datetime.max.replace(tzinfo=_UTC)
+_EARLIEST = datetime.min.replace(tzinfo=_UTC)
+IS_PYPY = platform.python_implementation() == 'PyPy'
+_ruamel_yaml = None
+if IS_PYPY:
+    # The libyaml bindings aren't available on PyPy; prefer ruamel.yaml's
+    # pure-Python loader there, which the JIT handles well
+    try:
+        from ruamel.yaml import YAML
+        _ruamel_yaml = YAML(typ='safe', pure=True)
+    except ImportError:
+        pass
+# PyYAML is only needed when ruamel.yaml isn't used
+yaml = SafeLoader = None
+if _ruamel_yaml is None:
+    import yaml
+    try:
+        # libyaml-backed loader is an order of magnitude faster than pure Python
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:
+        from yaml import SafeLoader
+        if not IS_PYPY:
+            print("⚠️  libyaml not available, falling back to pure-Python YAML loader (install libyaml-dev)")
+try:
+    # Optional Rust-backed HTML minifier, much faster than HTMLMinifier below
+    import minify_html as _minify_html
+except ImportError:
+    _minify_html = None
+try:
+    # Single-pass variant of minify-html: faster still, but rejects malformed markup
+    import minify_html_onepass as _minify_html_onepass
+except ImportError:
+    _minify_html_onepass = None
+try:
+    # Optional C JSON encoder, several times faster than the stdlib one
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    # Optional xxh3 hashing for the build cache; falls back to hashlib
+    import xxhash
+except ImportError:
+    xxhash = None
 from pathlib import Path
+# CSS/JS minifiers live in _minify so they can optionally be Cython-compiled
+import _minify
+from _minify import minify_css, minify_js
 from html.parser import HTMLParser
-from xml.sax.saxutils import escape
+from xml.sax.saxutils import escape, quoteattr
+
+
+# Per-file progress goes through this logger; it is only shown with --verbose
+logger = logging.getLogger('build')
+
+# Patterns used on every event, compiled once at import time
+_ISO_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+_TIME_RE = re.compile(r'(\d{1,2}:\d{2}\s*[APMapm]{2})')
+_HOUR_RE = re.compile(r'(\d{1,2})(?:st|nd|rd|th)?\s*Hour', re.IGNORECASE)
+_SLUG_RE = re.compile(r'[^a-z0-9]+')
+
+# Template for a single <item> in the generated RSS feeds
+_RSS_ITEM_TEMPLATE = """    <item>
+      <title>{title}</title>
+      <description><![CDATA[{description}]]></description>
+      <pubDate>{pub_date}</pubDate>
+      <link>{link}</link>
+      <guid isPermaLink="false">{guid}</guid>
+    </item>"""
+
+# Data files converted to JSON, each read from <name>.json or <name>.yaml
+DATA_FILES = ('schedule', 'events', 'team')
+
+# Output directories for the generated event RSS feeds
+EVENT_FEED_DIRS = ('events', os.path.join('events', 'current'), os.path.join('events', 'past'))
+
+# Incremental build cache: source fingerprints plus minified outputs keyed by content hash
+BUILD_CACHE_FILE = '.buildcache.json'
+BUILD_CACHE_DIR = '.buildcache'
+# Sources at least this large are memory-mapped instead of read into a bytes copy
+MMAP_MIN_SIZE = 4096
+
+# Date formats accepted by parse_event_date, tried in order
+_DATE_FORMATS = ('%Y-%m-%d', '%d %B %Y', '%d %b %Y')
+# Full and abbreviated English month names, for parsing "10 October 2025" / "10 Oct 2025" without strptime
+_MONTH_NAMES = ('January', 'February', 'March', 'April', 'May', 'June', 'July',
+                'August', 'September', 'October', 'November', 'December')
+_MONTHS = {name.lower(): i for i, name in enumerate(_MONTH_NAMES, 1)}
+_MONTHS.update({name[:3].lower(): i for i, name in enumerate(_MONTH_NAMES, 1)})
+
+
+# HTML elements that never have an end tag
+_VOID_ELEMENTS = frozenset(('area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
+                            'link', 'meta', 'source', 'track', 'wbr'))
 
 
 class HTMLMinifier(HTMLParser):
     """Simple HTML minifier that removes unnecessary whitespace but preserves script/style content"""
     def __init__(self):
         super().__init__()
-        self.output = io.StringIO()
+        self._parts = []
         self.in_pre = False
         self.in_script = False
         self.in_style = False
     
     def handle_decl(self, decl):
         """Preserve DOCTYPE declaration"""
-        self.output.write(f'<!{decl}>')
+        self._parts.append(f'<!{decl}>')
         
     def handle_starttag(self, tag, attrs):
         if tag == 'pre':
@@ -45,14 +153,22 @@ class HTMLMinifier(HTMLParser):
             self.in_script = True
         if tag == 'style':
             self.in_style = True
-        self.output.write(f'<{tag}')
-        for attr, value in attrs:
-            if value is None:
-                self.output.write(f' {attr}')
-            else:
-                self.output.write(f' {attr}="{value}"')
-        self.output.write('>')
+        if not attrs:
+            self._parts.append(f'<{tag}>')
+            return
+        # HTMLParser has already unescaped attribute values, so re-quote them
+        attr_str = ''.join(f' {attr}' if value is None else f' {attr}={quoteattr(value)}'
+                           for attr, value in attrs)
+        self._parts.append(f'<{tag}{attr_str}>')
         
+    def handle_startendtag(self, tag, attrs):
+        # "<br/>", "<img ... />": void elements get the start tag alone, since
+        # browsers read a stray </br> as another <br>. Other self-closing tags
+        # (SVG <path/>, <script src=".."/>) keep their end tag as before
+        self.handle_starttag(tag, attrs)
+        if tag not in _VOID_ELEMENTS:
+            self.handle_endtag(tag)
+
     def handle_endtag(self, tag):
         if tag == 'pre':
             self.in_pre = False
@@ -60,100 +176,196 @@ class HTMLMinifier(HTMLParser):
             self.in_script = False
         if tag == 'style':
             self.in_style = False
-        self.output.write(f'</{tag}>')
+        self._parts.append(f'</{tag}>')
         
     def handle_data(self, data):
         if self.in_pre or self.in_script or self.in_style:
             # Preserve content in pre, script, and style tags
-            self.output.write(data)
+            self._parts.append(data)
         else:
-            # Remove extra whitespace in regular content
-            data = re.sub(r'\s+', ' ', data)
-            if data.strip():
-                self.output.write(data)
+            # Collapse whitespace runs to single spaces; str.split is cheaper
+            # than a regex for the short text nodes that make up most pages
+            words = data.split()
+            if words:
+                text = ' '.join(words)
+                if data[0].isspace():
+                    text = ' ' + text
+                if data[-1].isspace():
+                    text += ' '
+                self._parts.append(text)
                 
     def handle_comment(self, data):
         # Skip HTML comments but preserve code structure
         pass
         
     def get_minified(self):
-        return self.output.getvalue()
+        return ''.join(self._parts)
 
 
+def load_yaml(stream):
+    """Parse YAML from bytes or a binary stream with the fastest available safe loader"""
+    if _ruamel_yaml is not None:
+        return _ruamel_yaml.load(stream)
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+# donotbuild.yaml patterns, as given and classified by compile_exclusions
+Exclusions = namedtuple('Exclusions', ['patterns', 'suffixes', 'glob_re', 'substrings'])
+
+
+@functools.lru_cache(maxsize=1)
 def load_exclusions():
-    """Load exclusion patterns from donotbuild.yaml"""
+    """Load exclusion patterns from donotbuild.yaml, compiled for should_exclude.
+
+    Cached, so the file is read and compiled once per process: pool workers
+    inherit or warm the cache instead of receiving the patterns with every job.
+    """
     try:
-        with open('donotbuild.yaml', 'r') as f:
-            config = yaml.safe_load(f)
-            return config.get('exclude', [])
+        with open('donotbuild.yaml', 'rb') as f:
+            config = load_yaml(f)
+            patterns = config.get('exclude', [])
     except FileNotFoundError:
-        print("⚠️  donotbuild.yaml not found, using default exclusions")
-        return ['*.yaml', '*.yml', 'build.py', 'README.md', '.git*']
+        logger.warning("⚠️  donotbuild.yaml not found, using default exclusions")
+        patterns = ['*.yaml', '*.yml', 'build.py', '_minify.py', '_minify.c', 'build.c',
+                    '_minify.*.so', 'build.*.so', 'README.md', '.git*', '.buildcache*']
+    return compile_exclusions(patterns)
+
 
+def compile_exclusions(exclusions):
+    """Classify exclusion patterns once into an Exclusions tuple.
 
-def should_exclude(file_path, exclusions):
-    """Check if file matches any exclusion pattern"""
-    file_name = os.path.basename(file_path)
+    Extension patterns become a tuple of suffixes for a single
+    str.endswith() call, and all other glob patterns are folded into one
+    compiled alternation so a file name is checked against them in one match.
+    """
+    suffixes = []
+    glob_list = []
+    substr_list = []
     for pattern in exclusions:
-        if pattern.startswith('*.'):
-            # Extension match - check just the filename
-            ext = pattern[1:]
-            if file_name.endswith(ext):
-                return True
+        if pattern.startswith('*.') and not any(c in pattern[1:] for c in '*?['):
+            # Extension like "*.yaml"
+            suffixes.append(pattern[1:])
         elif '*' in pattern:
             # Glob pattern like "pixi.*"
-            import fnmatch
-            if fnmatch.fnmatch(file_name, pattern):
-                return True
-        elif pattern in file_path:
+            glob_list.append(pattern)
+        else:
             # Substring match for directories
+            substr_list.append(pattern)
+    glob_re = re.compile('|'.join(fnmatch.translate(p) for p in glob_list)) if glob_list else None
+    return Exclusions(tuple(exclusions), tuple(suffixes), glob_re, tuple(substr_list))
+
+
+def should_exclude(file_path, exclusions, file_name=None):
+    """Check if file matches any compiled exclusion pattern"""
+    _, suffixes, glob_re, substr_list = exclusions
+    if file_name is None:
+        file_name = os.path.basename(file_path)
+    if file_name.endswith(suffixes):
+        return True
+    if glob_re is not None and glob_re.match(file_name):
+        return True
+    for pattern in substr_list:
+        if pattern in file_path:
             return True
     return False
 
 
+def iter_source_files(directory, exclusions, output_dir):
+    """Yield an os.DirEntry for every buildable file under directory.
+
+    Hidden directories, the output directory and directories matching a
+    substring exclusion are pruned before descending into them.
+    """
+    substr_list = exclusions.substrings
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                if (entry.is_symlink() or entry.name.startswith('.') or entry.name == output_dir
+                        or any(pattern in entry.path for pattern in substr_list)):
+                    continue
+                yield from iter_source_files(entry.path, exclusions, output_dir)
+            elif not should_exclude(entry.path, exclusions, entry.name):
+                yield entry
+
+
 def minify_html(html_content):
-    """Minify HTML content"""
+    """Minify HTML content, preferring the native minify-html packages"""
+    if _minify_html_onepass is not None:
+        try:
+            # Inline <script>/<style> are left as-is, like HTMLMinifier does
+            return _minify_html_onepass.minify(html_content, minify_css=False, minify_js=False)
+        except Exception as e:
+            logger.warning(f"⚠️  minify-html-onepass failed: {e}, falling back")
+    if _minify_html is not None:
+        try:
+            # Inline <script>/<style> are left as-is, like HTMLMinifier does
+            return _minify_html.minify(
+                html_content,
+                minify_css=False,
+                minify_js=False,
+                keep_closing_tags=True,
+            )
+        except Exception as e:
+            logger.warning(f"⚠️  minify-html failed: {e}, falling back to built-in minifier")
     try:
         minifier = HTMLMinifier()
         minifier.feed(html_content)
         minified = minifier.get_minified()
         return minified
     except Exception as e:
-        print(f"⚠️  HTML minification failed: {e}, using original")
+        logger.warning(f"⚠️  HTML minification failed: {e}, using original")
         return html_content
 
 
-def minify_css(css_content):
-    """Basic CSS minification"""
-    # Remove comments
-    css = re.sub(r'/\*.*?\*/', '', css_content, flags=re.DOTALL)
-    # Remove whitespace
-    css = re.sub(r'\s+', ' ', css)
-    css = re.sub(r'\s*([{}:;,])\s*', r'\1', css)
-    return css.strip()
+def minify_html_bytes(html_bytes):
+    """minify_html for raw UTF-8 file contents (bytes or mmap)"""
+    return minify_html(str(html_bytes, 'utf-8'))
+
 
+# Third-party directories whose assets ship already minified and are copied as-is
+_PREMINIFIED_DIRS = ('vendor', 'node_modules')
 
-def minify_js(js_content):
-    """Basic JS minification - just remove multi-line comments and trim whitespace carefully"""
-    # Remove multi-line comments
-    js = re.sub(r'/\*.*?\*/', '', js_content, flags=re.DOTALL)
-    # Remove single-line comments but be very careful
-    js = re.sub(r'^\s*//.*?$', '', js, flags=re.MULTILINE)
-    # Only normalize excessive whitespace, don't collapse all spaces
-    js = re.sub(r'\n\s*\n', '\n', js)
-    return js
+# Minifier (bytes or mmap in, str or bytes out) and log label per file extension, used by process_file
+_MINIFIERS = {
+    'html': (minify_html_bytes, 'HTML'),
+    'css': (minify_css, 'CSS'),
+    'js': (minify_js, 'JS'),
+}
 
 
+@functools.lru_cache(maxsize=None)
 def parse_event_date(date_str):
-    """Parse various date formats and return datetime object or None"""
+    """Parse various date formats and return datetime object or None.
+
+    Results are memoized since recurring events share identical date strings.
+    """
     if not date_str or date_str.strip().upper() == 'TBA':
         return None
 
     # Extract date part before any comma (e.g., "15 October 2025, Thursday ...")
     date_part = date_str.split(',')[0].strip()
 
-    # Try ISO format first (YYYY-MM-DD)
-    for fmt in ['%Y-%m-%d', '%d %B %Y', '%d %b %Y']:
+    # Fast path for ISO format (YYYY-MM-DD) without going through strptime
+    if _ISO_DATE_RE.match(date_part):
+        year, month, day = date_part.split('-')
+        try:
+            return datetime(int(year), int(month), int(day))
+        except ValueError:
+            return None
+
+    # Fast path for "DD Month YYYY" and "DD Mon YYYY"
+    parts = date_part.split()
+    if len(parts) == 3:
+        day, month, year = parts
+        month = _MONTHS.get(month.lower())
+        if month and day.isdigit() and len(day) <= 2 and year.isdigit() and len(year) == 4:
+            try:
+                return datetime(int(year), month, int(day))
+            except ValueError:
+                return None
+
+    # Anything else (e.g. unpadded "2025-1-5") still goes through strptime
+    for fmt in _DATE_FORMATS:
         try:
             parsed_date = datetime.strptime(date_part, fmt).date()
             # Default time is midnight
@@ -164,12 +376,14 @@ def parse_event_date(date_str):
     return None
 
 
+@functools.lru_cache(maxsize=None)
 def parse_event_datetime_with_tz(date_str):
     """Return an aware UTC datetime parsed from a human date string.
 
     If the input contains a time, try to parse it (e.g. "(1:20PM)" or "1:20PM").
     If no timezone is present we assume Asia/Kolkata (IST) as requested and
     return a UTC-converted aware datetime. If parsing fails, return None.
+    Results are cached, so recurring date strings are only parsed once.
     """
     if not date_str or date_str.strip().upper() == 'TBA':
         return None
@@ -180,7 +394,7 @@ def parse_event_datetime_with_tz(date_str):
         return None
 
     # Attempt to extract time like 1:20PM or 01:20 PM
-    time_match = re.search(r'(\d{1,2}:\d{2}\s*[APMapm]{2})', date_str)
+    time_match = _TIME_RE.search(date_str)
     hour = 0
     minute = 0
     if time_match:
@@ -194,7 +408,7 @@ def parse_event_datetime_with_tz(date_str):
             pass
     else:
         # Try patterns like "1st Hour" or "2nd Hour" -> treat as hour:00
-        hour_match = re.search(r'(\d{1,2})(?:st|nd|rd|th)?\s*Hour', date_str, flags=re.IGNORECASE)
+        hour_match = _HOUR_RE.search(date_str)
         if hour_match:
             try:
                 hour = int(hour_match.group(1))
@@ -208,10 +422,9 @@ def parse_event_datetime_with_tz(date_str):
 
     # If ZoneInfo is available, assume Asia/Kolkata when unspecified
     try:
-        if ZoneInfo is not None:
-            local_tz = ZoneInfo('Asia/Kolkata')
-            local_dt = combined.replace(tzinfo=local_tz)
-            utc_dt = local_dt.astimezone(ZoneInfo('UTC'))
+        if _IST is not None:
+            local_dt = combined.replace(tzinfo=_IST)
+            utc_dt = local_dt.astimezone(_UTC)
             return utc_dt
         else:
             # ZoneInfo not available; return naive UTC-like datetime
@@ -221,85 +434,64 @@ def parse_event_datetime_with_tz(date_str):
         return combined
 
 
-def attach_date_utc_to_event(event):
-    """Attach a date_utc (ISO 8601 Z) field to the event dict if parsable."""
-    date_str = event.get('date') or ''
-    dt_utc = parse_event_datetime_with_tz(date_str)
+def _to_iso_z(dt_utc):
+    """Format a UTC datetime as ISO 8601 with a Z suffix (None passes through)."""
     if dt_utc is None:
-        event['date_utc'] = None
-    else:
-        # Produce RFC3339-like UTC string with Z
-        try:
-            # If tz-aware, convert to UTC and emit Z
-            if dt_utc.tzinfo is not None:
-                iso = dt_utc.astimezone(ZoneInfo('UTC')).isoformat()
-            else:
-                iso = dt_utc.isoformat()
-            # Normalize +00:00 to Z
-            if iso.endswith('+00:00'):
-                iso = iso.replace('+00:00', 'Z')
-            event['date_utc'] = iso
-        except Exception:
-            event['date_utc'] = dt_utc.isoformat()
+        return None
+    try:
+        # If tz-aware, convert to UTC and emit Z
+        if dt_utc.tzinfo is not None:
+            iso = dt_utc.astimezone(_UTC).isoformat()
+        else:
+            iso = dt_utc.isoformat()
+        # Normalize +00:00 to Z
+        if iso.endswith('+00:00'):
+            iso = iso.replace('+00:00', 'Z')
+        return iso
+    except Exception:
+        return dt_utc.isoformat()
+
+
+def attach_date_utc_to_event(event):
+    """Attach a date_utc (ISO 8601 Z) field to the event dict if parsable.
+
+    Returns the parsed UTC datetime (or None) so callers can categorize and
+    sort without re-parsing the string.
+    """
+    dt_utc = parse_event_datetime_with_tz(event.get('date') or '')
+    event['date_utc'] = _to_iso_z(dt_utc)
+    return dt_utc
 
 
 def generate_rss_feed(events, title, description, link, output_file):
-    """Generate RSS 2.0 feed for events"""
-    rss_items = []
-    
-    for event in events:
-        event_title = escape(event.get('title', 'Untitled Event'))
-        event_desc = escape(event.get('description', ''))
-        event_location = escape(event.get('location', 'TBD'))
-        event_duration = escape(event.get('duration', ''))
-        event_date_str = event.get('date', 'TBD')
-
-        # Prefer using date_utc if present for pubDate
-        event_date_utc = event.get('date_utc')
-        pub_date = None
-        if event_date_utc:
-            try:
-                # parse ISO format, fallback to now
-                pub_dt = datetime.fromisoformat(event_date_utc.replace('Z', '+00:00'))
-                pub_date = pub_dt.strftime('%a, %d %b %Y %H:%M:%S +0000')
-            except Exception:
-                pub_date = datetime.now().strftime('%a, %d %b %Y %H:%M:%S +0000')
-        else:
-            pub_date = datetime.now().strftime('%a, %d %b %Y %H:%M:%S +0000')
-        
-        # Build full description with all details
-        full_description = f"{event_desc}"
-        if event_location:
-            full_description += f"<br/><br/><strong>Location:</strong> {event_location}"
-        if event_duration:
-            full_description += f"<br/><strong>Duration:</strong> {event_duration}"
-        if event_date_str:
-            full_description += f"<br/><strong>Date:</strong> {escape(event_date_str)}"
-        
-        # Add optional links
-        if event.get('signup_url'):
-            signup_url = escape(event['signup_url'])
-            full_description += f'<br/><br/><a href="{signup_url}">Sign Up Here</a>'
-        if event.get('instructions_url'):
-            instructions_url = escape(event['instructions_url'])
-            full_description += f'<br/><a href="{instructions_url}">View Instructions</a>'
-        # Create unique GUID (using title + date_utc or date as unique identifier)
-        guid_id = event.get('date_utc') or event_date_str
-        guid = f"{link}/#{event_title.replace(' ', '-').lower()}-{guid_id}"
-
-        rss_item = f"""    <item>
-      <title>{event_title}</title>
-      <description><![CDATA[{full_description}]]></description>
-      <pubDate>{pub_date}</pubDate>
-      <link>{link}</link>
-      <guid isPermaLink="false">{guid}</guid>
-    </item>"""
-        rss_items.append(rss_item)
-    
-    # Build complete RSS feed
+    """Generate RSS 2.0 feed for events.
+
+    Items are streamed to a temporary file as they're built rather than
+    joined into one document string first; it replaces output_file only
+    once the feed is complete, so a failing event never leaves a truncated
+    feed in out/. The output directory must already exist (build_site
+    creates it up front).
+    """
+    # Also the pubDate of events without a parsable date
     last_build_date = datetime.now().strftime('%a, %d %b %Y %H:%M:%S +0000')
-    
-    rss_content = f"""<?xml version="1.0" encoding="UTF-8"?>
+
+    tmp_file = output_file + '.tmp'
+    try:
+        _write_rss_feed(tmp_file, events, title, description, link, last_build_date)
+        os.replace(tmp_file, output_file)
+    except BaseException:
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
+        raise
+
+    logger.info(f"✓ Generated RSS: {output_file}")
+    return output_file
+
+
+def _write_rss_feed(output_file, events, title, description, link, last_build_date):
+    """Stream the RSS document for generate_rss_feed into output_file"""
+    with open(output_file, 'w', encoding='utf-8') as f:
+        f.write(f"""<?xml version="1.0" encoding="UTF-8"?>
 <rss version="2.0" xmlns:atom="http://www.w3.org/2005/Atom">
   <channel>
     <title>{escape(title)}</title>
@@ -308,24 +500,97 @@ def generate_rss_feed(events, title, description, link, output_file):
     <atom:link href="{link}/events/index.xml" rel="self" type="application/rss+xml" />
     <language>en-us</language>
     <lastBuildDate>{last_build_date}</lastBuildDate>
-{chr(10).join(rss_items)}
-  </channel>
+""")
+        for event in events:
+            # Escape every field once up front
+            raw_title = event.get('title', 'Untitled Event')
+            event_title = escape(raw_title)
+            event_desc = escape(event.get('description', ''))
+            event_location = escape(event.get('location', 'TBD'))
+            event_duration = escape(event.get('duration', ''))
+            event_date_str = escape(event.get('date', 'TBD'))
+
+            # Prefer using date_utc if present for pubDate
+            event_date_utc = event.get('date_utc')
+            pub_date = last_build_date
+            if event_date_utc:
+                try:
+                    # parse ISO format, fallback to the build time
+                    pub_dt = datetime.fromisoformat(event_date_utc.replace('Z', '+00:00'))
+                    pub_date = pub_dt.strftime('%a, %d %b %Y %H:%M:%S +0000')
+                except Exception:
+                    pass
+
+            # Build full description with all details
+            desc_parts = [event_desc]
+            if event_location:
+                desc_parts.append(f"<br/><br/><strong>Location:</strong> {event_location}")
+            if event_duration:
+                desc_parts.append(f"<br/><strong>Duration:</strong> {event_duration}")
+            if event_date_str:
+                desc_parts.append(f"<br/><strong>Date:</strong> {event_date_str}")
+
+            # Add optional links
+            if event.get('signup_url'):
+                signup_url = escape(event['signup_url'])
+                desc_parts.append(f'<br/><br/><a href="{signup_url}">Sign Up Here</a>')
+            if event.get('instructions_url'):
+                instructions_url = escape(event['instructions_url'])
+                desc_parts.append(f'<br/><a href="{instructions_url}">View Instructions</a>')
+            # Create unique GUID (using title + date_utc or date as unique identifier)
+            guid_id = event.get('date_utc') or event_date_str
+            slug = _SLUG_RE.sub('-', raw_title.lower()).strip('-')
+            guid = f"{link}/#{slug}-{guid_id}"
+
+            f.write(_RSS_ITEM_TEMPLATE.format_map({
+                'title': event_title,
+                'description': ''.join(desc_parts),
+                'pub_date': pub_date,
+                'link': link,
+                'guid': guid,
+            }))
+            f.write('\n')
+        f.write("""  </channel>
 </rss>
-"""
-    
-    # Write RSS feed
-    os.makedirs(os.path.dirname(output_file), exist_ok=True)
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(rss_content)
-    
-    print(f"✓ Generated RSS: {output_file}")
-    return output_file
+""")
+
+
+def _json_default(obj):
+    """Serialize unquoted YAML dates/timestamps the way orjson does"""
+    if isinstance(obj, datetime):
+        if obj.tzinfo is None:
+            obj = obj.replace(tzinfo=timezone.utc)
+        return obj.isoformat()
+    if hasattr(obj, 'isoformat'):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
 
 def convert_yaml_to_json(yaml_file, output_dir):
-    """Convert YAML file to JSON and sort events by date"""
+    """Convert a YAML (or JSON) data file to JSON and sort events by date.
+
+    Returns a (converted, stale_at) tuple. stale_at is the ISO UTC time of
+    the next upcoming event, after which the output must be regenerated even
+    if the source is unchanged; it is None for files that don't depend on
+    the current time.
+    """
     try:
-        with open(yaml_file, 'r') as f:
-            data = yaml.safe_load(f)
+        stem = os.path.splitext(os.path.basename(yaml_file))[0]
+        output_file = os.path.join(output_dir, stem + '.json')
+        with open(yaml_file, 'rb') as f:
+            raw = f.read()
+
+        # JSON is a subset of YAML and parses ~100x faster, so try it first
+        try:
+            data = json.loads(raw)
+            is_json = True
+        except ValueError:
+            is_json = False
+
+        if not is_json:
+            data = load_yaml(raw)
+
+        stale_at = None
         
         # If this is events.yaml, categorize and sort events by date
         if 'current_events' in data or 'past_events' in data:
@@ -334,60 +599,37 @@ def convert_yaml_to_json(yaml_file, output_dir):
 
             # Combine and re-categorize based on date
             all_events = current_events + past_events
-            new_current = []
-            new_past = []
-
-            # Attach UTC dates to all events
-            for event in all_events:
-                attach_date_utc_to_event(event)
 
             # Determine now in UTC
-            if ZoneInfo is not None:
-                now_utc = datetime.now(ZoneInfo('UTC'))
+            if _UTC is not None:
+                now_utc = datetime.now(_UTC)
             else:
                 now_utc = datetime.utcnow()
 
+            # Attach UTC dates and categorize in one pass, keeping the parsed
+            # datetime alongside each event for sorting
+            new_current = []
+            new_past = []
             for event in all_events:
-                date_utc = event.get('date_utc')
-                if date_utc:
-                    try:
-                        ev_dt = datetime.fromisoformat(date_utc.replace('Z', '+00:00'))
-                        # Compare in UTC
-                        if ev_dt < now_utc:
-                            new_past.append(event)
-                        else:
-                            new_current.append(event)
-                    except Exception:
-                        # If parsing fails, treat as current
-                        new_current.append(event)
+                dt_utc = attach_date_utc_to_event(event)
+                # No date -> consider current
+                if dt_utc is not None and dt_utc < now_utc:
+                    new_past.append((dt_utc, event))
                 else:
-                    # No date -> consider current
-                    new_current.append(event)
+                    new_current.append((dt_utc, event))
 
             # Sorting: current ascending (earliest first), past descending (newest first)
-            def sort_key_asc(event):
-                d = event.get('date_utc')
-                if not d:
-                    return datetime.max
-                try:
-                    return datetime.fromisoformat(d.replace('Z', '+00:00'))
-                except Exception:
-                    return datetime.max
-
-            def sort_key_desc(event):
-                d = event.get('date_utc')
-                if not d:
-                    return datetime.min
-                try:
-                    return datetime.fromisoformat(d.replace('Z', '+00:00'))
-                except Exception:
-                    return datetime.min
-
-            new_current.sort(key=sort_key_asc)
-            new_past.sort(key=sort_key_desc, reverse=True)
+            new_current.sort(key=lambda pair: pair[0] or _LATEST)
+            new_past.sort(key=lambda pair: pair[0] or _EARLIEST, reverse=True)
+            new_current = [event for _, event in new_current]
+            new_past = [event for _, event in new_past]
 
             data['current_events'] = new_current
             data['past_events'] = new_past
+
+            # The output changes once the earliest upcoming event starts
+            upcoming = [e['date_utc'] for e in new_current if e.get('date_utc')]
+            stale_at = upcoming[0] if upcoming else None
             
             # Generate RSS feeds for events
             base_url = "https://neotechclub.qzz.io"
@@ -404,9 +646,8 @@ def convert_yaml_to_json(yaml_file, output_dir):
             
             # Copy to events/current/index.xml as well
             current_rss = os.path.join(output_dir, 'events', 'current', 'index.xml')
-            os.makedirs(os.path.dirname(current_rss), exist_ok=True)
             shutil.copy2(events_rss, current_rss)
-            print(f"✓ Copied RSS: {current_rss}")
+            logger.info(f"✓ Copied RSS: {current_rss}")
             
             # Past events RSS at events/past/index.xml
             past_rss = os.path.join(output_dir, 'events', 'past', 'index.xml')
@@ -418,64 +659,269 @@ def convert_yaml_to_json(yaml_file, output_dir):
                 past_rss
             )
         
-        # Write JSON output
-        output_file = os.path.join(output_dir, os.path.splitext(os.path.basename(yaml_file))[0] + '.json')
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
-        print(f"✓ Converted: {yaml_file} → {output_file}")
+        # Write JSON output, serialized in one go and written with a single os.write
+        if orjson is not None:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_NAIVE_UTC)
+        else:
+            payload = json.dumps(data, indent=2, default=_json_default)
+        write_output(output_file, payload)
+        logger.info(f"✓ Converted: {yaml_file} → {output_file}")
+        return True, stale_at
     except Exception as e:
-        print(f"✗ Failed to convert {yaml_file}: {e}")
+        logger.error(f"✗ Failed to convert {yaml_file}: {e}")
+        return False, None
+
+
+def write_output(output_path, content):
+    """Write text or bytes to output_path with a single open/write/close, bypassing buffered IO"""
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+    data = memoryview(content)
+    fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        while data:
+            written = os.write(fd, data)
+            data = data[written:]
+    finally:
+        os.close(fd)
+
+
+def copy_file(src_path, dst_path):
+    """Copy file contents in-kernel with sendfile, falling back to shutil.copyfile"""
+    try:
+        src = os.open(src_path, os.O_RDONLY)
+        try:
+            dst = os.open(dst_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                size = os.fstat(src).st_size
+                offset = 0
+                while offset < size:
+                    sent = os.sendfile(dst, src, offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+            finally:
+                os.close(dst)
+        finally:
+            os.close(src)
+    except (AttributeError, OSError):
+        # No sendfile on this platform (or not supported for these files)
+        shutil.copyfile(src_path, dst_path)
+
+
+def hash_bytes(data):
+    """Return a hex content hash, using xxh3-128 when xxhash is installed"""
+    if xxhash is not None:
+        return xxhash.xxh3_128_hexdigest(data)
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def cache_version():
+    """Identify the minifier setup so cached outputs are dropped when it changes"""
+    parts = [Path(os.path.abspath(__file__)).read_bytes(), Path(_minify.__file__).read_bytes()]
+    if _minify_html_onepass is not None:
+        backend = 'minify-html-onepass'
+    elif _minify_html is not None:
+        backend = 'minify-html'
+    else:
+        backend = 'builtin'
+    parts.append(backend.encode())
+    return hash_bytes(b''.join(parts))
+
+
+class BuildCache:
+    """Fingerprints from the previous build, persisted in BUILD_CACHE_FILE.
+
+    ``files`` maps each copied/minified source to [mtime_ns, size, hash] and
+    ``data`` maps each converted data file to [mtime_ns, size, hash,
+    stale_at], where stale_at is when its output next changes on its own
+    (an event moving from current to past). Minified outputs live in
+    BUILD_CACHE_DIR keyed by source hash.
+
+    The index sits next to that store rather than inside out/, so it is
+    never deployed and wiping out/ still leaves the minified outputs.
+    """
+
+    def __init__(self, version):
+        self.version = version
+        self.valid = False
+        self.files = {}
+        self.data = {}
+
+    def load(self):
+        """Read the previous index; a missing or outdated one leaves the cache invalid"""
+        try:
+            raw = Path(BUILD_CACHE_FILE).read_bytes()
+            cache = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        except (FileNotFoundError, ValueError):
+            return self
+        if cache.get('version') == self.version:
+            self.valid = True
+            self.files = cache.get('files', {})
+            self.data = cache.get('data', {})
+        return self
+
+    def save(self):
+        """Persist the index and drop cached outputs no longer referenced"""
+        index = {'version': self.version, 'files': self.files, 'data': self.data}
+        write_output(BUILD_CACHE_FILE, orjson.dumps(index) if orjson is not None else json.dumps(index))
+        live = {cached_output_name(path, entry[2]) for path, entry in self.files.items()}
+        if os.path.isdir(BUILD_CACHE_DIR):
+            for name in os.listdir(BUILD_CACHE_DIR):
+                if name not in live:
+                    os.remove(os.path.join(BUILD_CACHE_DIR, name))
+
+    @staticmethod
+    def clear():
+        """Delete the index and every cached output"""
+        if os.path.exists(BUILD_CACHE_FILE):
+            os.remove(BUILD_CACHE_FILE)
+        if os.path.isdir(BUILD_CACHE_DIR):
+            shutil.rmtree(BUILD_CACHE_DIR)
+
+
+def read_source(file_path, size):
+    """Return a source's contents: bytes for small files, a read-only mmap for large ones"""
+    if size < MMAP_MIN_SIZE:
+        return Path(file_path).read_bytes()
+    with open(file_path, 'rb') as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
 
+def close_source(content):
+    """Release a read_source result; bytes need nothing, an mmap is unmapped"""
+    if isinstance(content, mmap.mmap):
+        content.close()
 
-def process_file(file_path, output_dir, exclusions):
-    """Process a single file - minify if applicable, copy to output"""
+
+def fingerprint_file(file_path, cache_entry=None, fingerprint=None):
+    """Return ([mtime_ns, size, hash], content) for file_path.
+
+    fingerprint is an already known [mtime_ns, size], saving a stat. The
+    file is only read and hashed when its mtime/size differ from
+    cache_entry; content (see read_source) is None when the cached hash
+    was reused.
+    """
+    if fingerprint is None:
+        st = os.stat(file_path)
+        fingerprint = [st.st_mtime_ns, st.st_size]
+    if cache_entry and cache_entry[:2] == fingerprint:
+        return fingerprint + [cache_entry[2]], None
+    content = read_source(file_path, fingerprint[1])
+    return fingerprint + [hash_bytes(content)], content
+
+
+def cached_output_name(file_path, content_hash):
+    """Name of the cached minified output for a source with the given hash"""
+    return content_hash + os.path.splitext(file_path)[1]
+
+
+def remove_output(output_path, output_dir):
+    """Delete a stale output file and any directories it leaves empty"""
+    if os.path.exists(output_path):
+        os.remove(output_path)
+    directory = os.path.dirname(output_path)
+    while directory and os.path.abspath(directory) != os.path.abspath(output_dir):
+        try:
+            os.rmdir(directory)
+        except OSError:
+            break
+        directory = os.path.dirname(directory)
+
+
+def file_extension(file_path):
+    """Extension of file_path's name without the dot; '' when it has none"""
+    return os.path.splitext(file_path)[1][1:]
+
+
+def is_preminified(rel_path):
+    """True for *.min.* files and anything under a vendor/node_modules directory"""
+    dirs, _, name = rel_path.rpartition(os.sep)
+    return '.min.' in name or any(d in _PREMINIFIED_DIRS for d in dirs.split(os.sep))
+
+
+def process_file(file_path, output_dir, cache_entry=None, fingerprint=None, exclusions=None):
+    """Process a single file - minify if applicable, copy to output.
+
+    Sources whose fingerprint (mtime/size) or content hash matches
+    cache_entry are left alone when their output already exists. Minified
+    outputs are also stored in BUILD_CACHE_DIR keyed by source hash, so an
+    unchanged source is restored from there instead of being minified again.
+
+    Returns a (processed, message, cache_entry) tuple. Messages are printed
+    by the caller so output from parallel workers doesn't interleave. The
+    output directory must already exist. fingerprint is the source's
+    [mtime_ns, size] when the caller has already stat'ed it; exclusions
+    default to load_exclusions().
+    """
+    if exclusions is None:
+        exclusions = load_exclusions()
     if should_exclude(file_path, exclusions):
-        return False
+        return False, None, None
     
     # Create output path
     rel_path = os.path.relpath(file_path)
     output_path = os.path.join(output_dir, rel_path)
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
     
+    content = None
     try:
-        # Handle different file types
-        if file_path.endswith('.html'):
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            minified = minify_html(content)
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(minified)
-            print(f"✓ Minified HTML: {file_path}")
-            
-        elif file_path.endswith('.css'):
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            minified = minify_css(content)
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(minified)
-            print(f"✓ Minified CSS: {file_path}")
-            
-        elif file_path.endswith('.js') and not 'node_modules' in file_path:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            minified = minify_js(content)
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(minified)
-            print(f"✓ Minified JS: {file_path}")
-            
-        else:
-            # Copy other files as-is
-            shutil.copy2(file_path, output_path)
-            print(f"✓ Copied: {file_path}")
-        
-        return True
+        # Pick a minifier by extension; anything else is copied as-is
+        minifier, label = _MINIFIERS.get(file_extension(file_path), (None, None))
+        if minifier is not None and is_preminified(rel_path):
+            minifier, label = None, None
+
+        new_entry, content = fingerprint_file(file_path, cache_entry, fingerprint)
+        content_hash = new_entry[2]
+        unchanged = bool(cache_entry) and cache_entry[2] == content_hash
+
+        if unchanged and os.path.exists(output_path):
+            return True, f"✓ Unchanged: {file_path}", new_entry
+
+        if minifier is None:
+            copy_file(file_path, output_path)
+            return True, f"✓ Copied: {file_path}", new_entry
+
+        cached_output = os.path.join(BUILD_CACHE_DIR, cached_output_name(file_path, content_hash))
+        if unchanged and os.path.exists(cached_output):
+            copy_file(cached_output, output_path)
+            return True, f"✓ Cached {label}: {file_path}", new_entry
+
+        if content is None:
+            content = read_source(file_path, new_entry[1])
+        write_output(output_path, minifier(content))
+        copy_file(output_path, cached_output)
+        return True, f"✓ Minified {label}: {file_path}", new_entry
     except Exception as e:
-        print(f"✗ Failed to process {file_path}: {e}")
-        return False
+        return False, f"✗ Failed to process {file_path}: {e}", None
+    finally:
+        # Don't leave an mmap for the GC to unmap (PyPy frees it late)
+        close_source(content)
+
+
+def parse_utc_iso(value):
+    """Parse a date_utc-style ISO string into an aware UTC datetime"""
+    dt = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt
+
+
+def data_outputs(data_file, output_dir):
+    """Output files generated from a data file"""
+    stem = os.path.splitext(data_file)[0]
+    outputs = [os.path.join(output_dir, stem + '.json')]
+    if stem == 'events':
+        outputs.extend(os.path.join(output_dir, d, 'index.xml') for d in EVENT_FEED_DIRS)
+    return outputs
 
 
-def build_site():
-    """Main build function"""
+def build_site(force=False, clean=False):
+    """Main build function.
+
+    force reprocesses every file while keeping out/; clean deletes out/ and
+    the build cache first. Per-file progress is logged at INFO level on the
+    'build' logger; by default only the per-extension totals are printed.
+    """
     print("=" * 60)
     print("🔨 NeoTech Club Website Build")
     print("=" * 60)
@@ -486,45 +932,133 @@ def build_site():
     
     output_dir = 'out'
     exclusions = load_exclusions()
+    print(f"\n📋 Exclusions: {', '.join(exclusions.patterns)}\n")
     
-    print(f"\n📋 Exclusions: {', '.join(exclusions)}\n")
-    
-    # Clean and create output directory
-    if os.path.exists(output_dir):
+    # Reuse the previous output when the build cache is valid, otherwise start clean
+    if clean:
+        BuildCache.clear()
+    previous = BuildCache(cache_version()).load()
+    if not previous.valid and os.path.exists(output_dir):
         shutil.rmtree(output_dir)
-    os.makedirs(output_dir)
+    os.makedirs(BUILD_CACHE_DIR, exist_ok=True)
+    cache = BuildCache(previous.version)
+
+    # Data files are converted rather than copied; <name>.json takes
+    # precedence over <name>.yaml as a faster-to-parse alternative
+    data_files = []
+    for name in DATA_FILES:
+        for ext in ('.json', '.yaml'):
+            if os.path.exists(name + ext):
+                data_files.append(name + ext)
+                break
+
+    file_entries = [e for e in iter_source_files('.', exclusions, output_dir)
+                    if os.path.relpath(e.path) not in data_files]
+
+    # Create every output directory once up front, so neither the RSS writers
+    # nor the pool workers need a makedirs (stat + mkdir per component) per file
+    output_dirs = {os.path.dirname(os.path.join(output_dir, os.path.relpath(e.path))) for e in file_entries}
+    output_dirs.update(os.path.join(output_dir, d) for d in EVENT_FEED_DIRS)
+    for directory in sorted(output_dirs):
+        os.makedirs(directory, exist_ok=True)
     
     # Convert YAML files to JSON
     print("\n📄 Converting YAML to JSON...")
-    yaml_files = ['schedule.yaml', 'events.yaml', 'team.yaml']
-    
-    for yaml_file in yaml_files:
-        if os.path.exists(yaml_file):
-            convert_yaml_to_json(yaml_file, output_dir)
+    now_utc = datetime.now(timezone.utc)
+    for data_file in data_files:
+        cached = previous.data.get(data_file)
+        entry, content = fingerprint_file(data_file, cached)
+        close_source(content)
+        if (not force and cached and cached[2] == entry[2]
+                and (cached[3] is None or now_utc < parse_utc_iso(cached[3]))
+                and all(os.path.exists(p) for p in data_outputs(data_file, output_dir))):
+            cache.data[data_file] = entry + [cached[3]]
+            logger.info(f"✓ Unchanged: {data_file}")
+            continue
+        converted, stale_at = convert_yaml_to_json(data_file, output_dir)
+        if converted:
+            cache.data[data_file] = entry + [stale_at]
     
     # Process all other files
     print("\n📦 Processing files...")
-    processed = 0
-    for root, dirs, files in os.walk('.'):
-        # Skip hidden directories and output dir
-        dirs[:] = [d for d in dirs if not d.startswith('.') and d != 'out']
-        
-        for file in files:
-            file_path = os.path.join(root, file)
-            if process_file(file_path, output_dir, exclusions):
-                processed += 1
+    # Files are independent, so minify/copy them across all cores. This needs
+    # processes rather than threads: the regex and HTMLParser minifiers and
+    # the minify-html bindings all hold the GIL while they run
+    processed = Counter()
+    results = []
+    job_paths, job_entries, job_fingerprints = [], [], []
+    for file_entry in file_entries:
+        file_path = file_entry.path
+        # The stat scandir's DirEntry caches is reused instead of each worker stat'ing again
+        try:
+            st = file_entry.stat()
+            fingerprint = [st.st_mtime_ns, st.st_size]
+        except OSError:
+            # Dangling symlink or deleted mid-walk; process_file reports the failure
+            fingerprint = None
+        cached = None if force else previous.files.get(file_path)
+        if (cached and fingerprint and cached[:2] == fingerprint
+                and os.path.exists(os.path.join(output_dir, os.path.relpath(file_path)))):
+            # Untouched since the last build, so not worth sending to a worker
+            results.append((file_path, (True, f"✓ Unchanged: {file_path}", cached)))
+            continue
+        job_paths.append(file_path)
+        job_entries.append(cached)
+        job_fingerprints.append(fingerprint)
+    job_args = (job_paths, repeat(output_dir), job_entries, job_fingerprints)
+    workers = min(os.cpu_count() or 1, len(job_paths))
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers, initializer=load_exclusions) as executor:
+            chunksize = max(1, len(job_paths) // (workers * 4))
+            results.extend(zip(job_paths, executor.map(process_file, *job_args, chunksize=chunksize)))
+    else:
+        # A single worker would only add process startup and pickling overhead
+        results.extend(zip(job_paths, map(process_file, *job_args)))
+    for file_path, (ok, message, entry) in results:
+        if ok:
+            processed[file_extension(file_path) or 'other'] += 1
+            logger.info(message)
+        elif message:
+            logger.error(message)
+        if entry:
+            cache.files[file_path] = entry
+
+    # Drop outputs whose source was deleted or is now excluded
+    for file_path in previous.files.keys() - cache.files.keys():
+        remove_output(os.path.join(output_dir, os.path.relpath(file_path)), output_dir)
+        logger.info(f"✓ Removed: {file_path}")
+    for data_file in previous.data.keys() - cache.data.keys():
+        if os.path.splitext(data_file)[0] in {os.path.splitext(d)[0] for d in data_files}:
+            continue
+        for output_path in data_outputs(data_file, output_dir):
+            remove_output(output_path, output_dir)
+        logger.info(f"✓ Removed: {data_file}")
+    cache.save()
     
     print("\n" + "=" * 60)
-    print(f"✅ Build complete! Processed {processed} files")
+    totals = ', '.join(f"{ext}: {count}" for ext, count in sorted(processed.items()))
+    print(f"✅ Build complete! Processed {sum(processed.values())} files ({totals})")
     print(f"📁 Output directory: {os.path.abspath(output_dir)}")
     print("=" * 60)
 
 
-if __name__ == '__main__':
+def main(argv=None):
+    """Command-line entry point; also used to run a Cython-compiled build module"""
+    parser = argparse.ArgumentParser(description="Build the NeoTech Club website into out/")
+    parser.add_argument('-v', '--verbose', action='store_true', help="log every processed file")
+    parser.add_argument('--force', action='store_true', help="reprocess every file, ignoring the build cache")
+    parser.add_argument('--clean', action='store_true', help="delete out/ and the build cache before building")
+    args = parser.parse_args(argv)
+    logging.basicConfig(stream=sys.stdout, format='%(message)s',
+                        level=logging.INFO if args.verbose else logging.WARNING)
     try:
-        build_site()
+        build_site(force=args.force, clean=args.clean)
     except KeyboardInterrupt:
         print("\n\n⚠️  Build cancelled by user")
     except Exception as e:
         print(f"\n\n✗ Build failed: {e}")
         raise
+
+
+if __name__ == '__main__':
+    main()